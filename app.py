@@ -1,39 +1,307 @@
-from flask import Flask, render_template_string, request, redirect, url_for
+from flask import Flask, Response, request, redirect, stream_with_context, url_for
+from streaming_form_data import ParseFailedException, StreamingFormDataParser
+from streaming_form_data.targets import FileTarget
 from werkzeug.utils import secure_filename
+import atexit
 import os
 import base64
+import shutil
+import tempfile
 from io import BytesIO
-from typing import Tuple
+from typing import Dict, Iterable, Iterator, NamedTuple
 
 import cv2
 from modules import basic_analysis, comparative, preprocessing
 
+# Параллелизм обеспечивают процессы и потоки WSGI-сервера, поэтому
+# внутренние потоки OpenCV ограничиваются (по умолчанию одним на запрос),
+# чтобы не перегружать ядра; OpenCL отключается, чтобы первый вызов не
+# тратил время на поиск устройств
+cv2.setNumThreads(int(os.environ.get('CV2_THREADS', '1')))
+cv2.ocl.setUseOpenCL(False)
+
+
+def _default_upload_folder() -> str:
+    """Выбирает папку для загрузок.
+
+    На Linux загрузки по возможности сохраняются в tmpfs (``/dev/shm``):
+    файл сразу после сохранения читается OpenCV, и обе операции
+    выполняются в оперативной памяти без обращения к диску. Каталог
+    создаётся через ``tempfile.mkdtemp`` — со случайным именем и правами
+    0700, поэтому другие пользователи не могут подменить или прочитать
+    загрузки; при завершении процесса он удаляется. Папку можно
+    переопределить переменной окружения ``UPLOAD_FOLDER``.
+    """
+    configured = os.environ.get('UPLOAD_FOLDER')
+    if configured:
+        os.makedirs(configured, mode=0o700, exist_ok=True)
+        return configured
+    shm = '/dev/shm'
+    base = shm if os.path.isdir(shm) and os.access(shm, os.W_OK) else None
+    folder = tempfile.mkdtemp(prefix='signature_detector_uploads_', dir=base)
+    atexit.register(shutil.rmtree, folder, ignore_errors=True)
+    return folder
+
+
 # Папка для загрузки временных изображений
-UPLOAD_FOLDER = 'uploads'
+UPLOAD_FOLDER = _default_upload_folder()
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg'}
+# Допустимые суффиксы имён файлов для проверки через str.endswith
+_ALLOWED_SUFFIXES = tuple('.' + ext for ext in ALLOWED_EXTENSIONS)
+# Запросы меньше этого размера разбираются стандартным парсером Werkzeug,
+# большие — потоково, блоками по _UPLOAD_CHUNK_SIZE байт
+STREAMING_UPLOAD_THRESHOLD = 1024 * 1024
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+# Максимальный размер запроса в мегабайтах. Загрузки хранятся в tmpfs,
+# то есть в оперативной памяти, поэтому размер ограничивается: Werkzeug
+# ограничивает request.stream и отвечает 413 на более крупные запросы
+MAX_UPLOAD_MB = int(os.environ.get('MAX_UPLOAD_MB', '32'))
 
 app = Flask(__name__)
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_MB * 1024 * 1024
+
+# Шаблоны страниц компилируются один раз при импорте модуля, а не при
+# каждом запросе, как это делает render_template_string
+_INDEX_FORM_TMPL = app.jinja_env.from_string(
+    """
+    <h1>Детектор подписей</h1>
+    <p>Загрузите изображение рукописного текста или подписи для анализа.</p>
+    <form method="post" enctype="multipart/form-data">
+        <input type="file" name="file" accept="image/*">
+        <input type="submit" value="Анализировать">
+    </form>
+    <p>Или <a href="{{ url_for('compare') }}">перейдите к сравнительному анализу двух изображений</a>.</p>
+    """
+)
+
+# Страница результатов анализа отдаётся по частям: заголовок с текстовым
+# отчётом, затем блоки с изображениями по мере их кодирования и ссылки
+_INDEX_RESULT_HEAD_TMPL = app.jinja_env.from_string(
+    """
+    <h1>Результаты анализа</h1>
+    <p>{{ result.replace('\n', '<br>')|safe }}</p>
+    """
+)
+
+_INDEX_IMAGE_TMPL = app.jinja_env.from_string(
+    """
+    {% if src %}
+    <h2>{{ title }}</h2>
+    <img src="{{ src }}" style="max-width:45%; height:auto; border:1px solid #ccc;">
+    {% endif %}
+    """
+)
+
+_INDEX_RESULT_FOOT_TMPL = app.jinja_env.from_string(
+    """
+    <p><a href="{{ url_for('index') }}">Загрузить другое изображение</a> | <a href="{{ url_for('compare') }}">Сравнение</a></p>
+    """
+)
+
+_COMPARE_FORM_TMPL = app.jinja_env.from_string(
+    """
+    <h1>Сравнение двух образцов</h1>
+    <p>Загрузите два изображения (спорный документ и образец) для сравнения.</p>
+    <form method="post" enctype="multipart/form-data">
+        <label>Спорное изображение: <input type="file" name="file_a" accept="image/*"></label><br><br>
+        <label>Образец для сравнения: <input type="file" name="file_b" accept="image/*"></label><br><br>
+        <input type="submit" value="Сравнить">
+    </form>
+    <p><a href="{{ url_for('index') }}">На главную</a></p>
+    """
+)
+
+_COMPARE_RESULT_TMPL = app.jinja_env.from_string(
+    """
+    <h1>Сравнительный анализ</h1>
+    <p>Коэффициент сходства: {{ "%.2f"|format(similarity) }}</p>
+    <p>Интерпретация: {{ interpretation }}</p>
+    <h2>Исходные изображения</h2>
+    {% if img_a_b64 %}<img src="{{ img_a_b64 }}" style="max-width:45%; border:1px solid #ccc;">{% endif %}
+    {% if img_b_b64 %}<img src="{{ img_b_b64 }}" style="max-width:45%; border:1px solid #ccc;">{% endif %}
+    <h2>Детали</h2>
+    <ul>
+        <li>Средний размер букв: {{ "%.1f"|format(details['size_avg'][0]) }} vs {{ "%.1f"|format(details['size_avg'][1]) }}</li>
+        <li>Разгон между буквами: {{ "%.1f"|format(details['spacing_avg'][0]) }} vs {{ "%.1f"|format(details['spacing_avg'][1]) }}</li>
+        <li>Наклон: {{ "%.1f"|format(details['slant'][0]) }}° vs {{ "%.1f"|format(details['slant'][1]) }}°</li>
+        <li>Коэффициент связности: {{ "%.2f"|format(details['connectivity'][0]) }} vs {{ "%.2f"|format(details['connectivity'][1]) }}</li>
+    </ul>
+    <a href="{{ url_for('compare') }}">Сравнить другие изображения</a> | <a href="{{ url_for('index') }}">На главную</a>
+    """
+)
 
-# Создаем папку для загрузок, если её нет
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+_COMPARE_ERROR_TMPL = app.jinja_env.from_string(
+    """
+    <h1>Ошибка</h1>
+    <p>{{ error }}</p>
+    <a href="{{ url_for('compare') }}">Вернуться</a>
+    """
+)
 
 
 def allowed_file(filename: str) -> bool:
     """Проверяет, соответствует ли файл допустимым расширениям."""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return filename.lower().endswith(_ALLOWED_SUFFIXES)
+
+
+class _Upload(NamedTuple):
+    """Сохранённый файл: путь на сервере и имя для показа пользователю."""
+    path: str
+    filename: str
+
+
+def _unique_upload_path(filename: str) -> str:
+    """Резервирует в папке загрузок файл с уникальным именем.
+
+    Одновременные запросы с одинаковыми именами файлов не перезаписывают
+    загрузки друг друга; от исходного имени сохраняется только расширение.
+
+    :param filename: имя файла, переданное клиентом
+    :return: путь к созданному пустому файлу
+    """
+    suffix = os.path.splitext(secure_filename(filename))[1].lower()
+    fd, filepath = tempfile.mkstemp(suffix=suffix, dir=UPLOAD_FOLDER)
+    os.close(fd)
+    return filepath
+
+
+def _remove_uploads(uploads: Iterable[_Upload]) -> None:
+    """Удаляет загруженные файлы после обработки запроса.
+
+    :param uploads: файлы, возвращённые ``_save_uploads``
+    """
+    for upload in uploads:
+        try:
+            os.remove(upload.path)
+        except FileNotFoundError:
+            pass
+
+
+def _save_uploads(*field_names: str) -> Dict[str, _Upload]:
+    """Сохраняет файлы из multipart-запроса в папку загрузок.
+
+    Небольшие запросы обрабатываются через ``request.files``. Большие
+    читаются из ``request.stream`` блоками по 64 КБ и разбираются
+    парсером streaming-form-data, который пишет данные сразу на диск:
+    парсер форм Werkzeug на крупных файлах расходует много процессорного
+    времени.
+
+    :param field_names: имена полей формы с файлами
+    :return: словарь «имя поля → сохранённый файл»; в него попадают
+        только поля с непустым именем файла допустимого типа. Имя для
+        показа — ``secure_filename`` от имени, переданного клиентом.
+        Для некорректного multipart-тела возвращается пустой словарь.
+        Файлы нужно удалить через ``_remove_uploads``
+    """
+    saved: Dict[str, _Upload] = {}
+    content_length = request.content_length
+    if content_length is not None and content_length < STREAMING_UPLOAD_THRESHOLD:
+        for name in field_names:
+            file = request.files.get(name)
+            if file and file.filename and allowed_file(file.filename):
+                filepath = _unique_upload_path(file.filename)
+                file.save(filepath)
+                saved[name] = _Upload(filepath, secure_filename(file.filename))
+        return saved
+    # Имя файла станет известно только после разбора заголовков части,
+    # поэтому сначала пишем во временный файл, а затем переименовываем
+    targets: Dict[str, FileTarget] = {}
+    try:
+        parser = StreamingFormDataParser(headers=request.headers)
+        for name in field_names:
+            fd, tmp_path = tempfile.mkstemp(suffix='.part', dir=UPLOAD_FOLDER)
+            os.close(fd)
+            targets[name] = FileTarget(tmp_path)
+            parser.register(name, targets[name])
+        while chunk := request.stream.read(_UPLOAD_CHUNK_SIZE):
+            parser.data_received(chunk)
+        for name, target in targets.items():
+            filename = target.multipart_filename
+            if filename and allowed_file(filename):
+                filepath = _unique_upload_path(filename)
+                os.replace(target.filename, filepath)
+                saved[name] = _Upload(filepath, secure_filename(filename))
+    except ParseFailedException:
+        # Тело запроса не является корректной multipart-формой: ведём себя
+        # так же, как при отсутствии файлов в небольшом запросе
+        return {}
+    finally:
+        for target in targets.values():
+            if os.path.exists(target.filename):
+                os.remove(target.filename)
+    return saved
+
+
+# Параметры кодирования изображений для вставки в HTML: JPEG кодируется
+# значительно быстрее PNG и даёт меньший объём для сканов и фотографий
+_ENCODE_PARAMS = {
+    '.jpg': [cv2.IMWRITE_JPEG_QUALITY, 85, cv2.IMWRITE_JPEG_OPTIMIZE, 0],
+    '.png': [],
+}
+_MIME_TYPES = {'.jpg': 'image/jpeg', '.png': 'image/png'}
 
 
-def _image_to_base64(img) -> str:
-    """Преобразует изображение NumPy в строку base64 для вставки в HTML."""
+def _image_to_base64(img, ext: str = '.jpg') -> str:
+    """Преобразует изображение NumPy в строку base64 для вставки в HTML.
+
+    По умолчанию используется JPEG; для бинарных изображений лучше
+    передавать ``ext='.png'``, чтобы избежать артефактов сжатия.
+    Одноканальные изображения кодируются без преобразования в BGR.
+    """
     if img is None:
         return ''
-    # Кодируем в PNG в буфер
-    ret, buffer = cv2.imencode('.png', img)
+    ret, buffer = cv2.imencode(ext, img, _ENCODE_PARAMS[ext])
     if not ret:
         return ''
-    b64 = base64.b64encode(buffer).decode('utf-8')
-    return f"data:image/png;base64,{b64}"
+    # base64 читает сжатый поток напрямую через буферный протокол, без
+    # промежуточной копии в bytes; результат заведомо состоит из ASCII
+    b64 = base64.b64encode(memoryview(buffer)).decode('ascii')
+    return f"data:{_MIME_TYPES[ext]};base64,{b64}"
+
+
+def _index_result_stream(result: str, filepath: str) -> Iterator[str]:
+    """Формирует страницу результатов анализа по частям.
+
+    Текстовый отчёт отправляется сразу, а каждое изображение — как только
+    оно закодировано, поэтому браузер начинает отрисовку раньше, а в памяти
+    одновременно держится только одна строка base64.
+
+    :param result: текстовый отчёт базового анализа
+    :param filepath: путь к загруженному изображению
+    :return: генератор фрагментов HTML
+    """
+    yield _INDEX_RESULT_HEAD_TMPL.render(result=result)
+    try:
+        # Изображения уже загружены и обработаны при анализе — берём их из
+        # кэша; вместо оригинала там хранится только его превью
+        original_preview = preprocessing.load_preview_cached(filepath)
+        yield _INDEX_IMAGE_TMPL.render(title='Исходное изображение',
+                                       src=_image_to_base64(original_preview))
+        processed_img = preprocessing.preprocess_image_cached(filepath)
+        scale = original_preview.shape[1] / processed_img.shape[1]
+        yield _INDEX_IMAGE_TMPL.render(title='Бинаризованное изображение',
+                                       src=_image_to_base64(preprocessing.make_preview(processed_img)[0],
+                                                            ext='.png'))
+        # segment_text возвращает список отдельных изображений строк, но без координат.
+        # Поэтому вычисляем горизонтальную проекцию и находим границы строк заново.
+        proj = preprocessing.row_projection(processed_img)
+        del processed_img
+        threshold = proj.max() * 0.1 if proj.size > 0 else 0
+        starts, ends = preprocessing.find_line_bounds(proj, threshold)
+        # Прямоугольники сегментации рисуются на копии кэшированного превью
+        seg_overlay = original_preview.copy()
+        width = seg_overlay.shape[1]
+        for start, end in zip(starts, ends):
+            top = int(start * scale)
+            bottom = int((end - 1) * scale)
+            cv2.rectangle(seg_overlay, (0, top), (width - 1, bottom), (0, 255, 0), 2)
+        yield _INDEX_IMAGE_TMPL.render(title='Сегментация строк',
+                                       src=_image_to_base64(seg_overlay))
+    except Exception:
+        # Изображения лишь иллюстрируют отчёт: при ошибке выводим страницу без них
+        pass
+    yield _INDEX_RESULT_FOOT_TMPL.render()
 
 
 @app.route('/', methods=['GET', 'POST'])
@@ -44,89 +312,23 @@ def index():
     На этапе 1 выполняется только сохранение и возврат тестового результата.
     """
     if request.method == 'POST':
-        if 'file' not in request.files:
-            return redirect(request.url)
-        file = request.files['file']
-        if file.filename == '':
+        upload = _save_uploads('file').get('file')
+        if upload is None:
             return redirect(request.url)
-        if file and allowed_file(file.filename):
-            filename = secure_filename(file.filename)
-            filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            file.save(filepath)
-            # Вызываем базовый анализ
-            result = basic_analysis.analyze_handwriting(filepath)
-            # Дополнительно генерируем изображения: исходное, бинаризованное, сегментация
-            try:
-                original_img = preprocessing.load_image(filepath)
-                processed_img = preprocessing.preprocess_image(original_img)
-                # Подготавливаем изображение сегментации: копия исходного + прямоугольники вокруг строк
-                seg_overlay = original_img.copy()
-                lines = preprocessing.segment_text(processed_img)
-                y_offset = 0
-                # Для каждого сегмента найдём его вертикальные координаты относительно общего изображения
-                # segment_text возвращает список отдельных изображений строк, но без координат.
-                # Для простоты вычислим горизонтальную проекцию снова.
-                proj = (processed_img // 255).sum(axis=1)
-                max_val = proj.max() if proj.size > 0 else 0
-                threshold = max_val * 0.1 if max_val else 0
-                in_line = False
-                start = 0
-                for idx, val in enumerate(proj):
-                    if val > threshold and not in_line:
-                        in_line = True
-                        start = idx
-                    elif val <= threshold and in_line:
-                        end = idx
-                        cv2.rectangle(seg_overlay, (0, start), (seg_overlay.shape[1]-1, end), (0, 255, 0), 2)
-                        in_line = False
-                if in_line:
-                    end = len(proj)-1
-                    cv2.rectangle(seg_overlay, (0, start), (seg_overlay.shape[1]-1, end), (0, 255, 0), 2)
-                # Конвертируем изображения в base64
-                original_b64 = _image_to_base64(original_img)
-                processed_b64 = _image_to_base64(cv2.cvtColor(processed_img, cv2.COLOR_GRAY2BGR))
-                overlay_b64 = _image_to_base64(seg_overlay)
-            except Exception:
-                original_b64 = processed_b64 = overlay_b64 = ''
-            return render_template_string(
-                """
-                <h1>Результаты анализа</h1>
-                <p>{{ result.replace('\n', '<br>')|safe }}</p>
-                {% if original_b64 %}
-                <h2>Исходное изображение</h2>
-                <img src="{{ original_b64 }}" style="max-width:45%; height:auto; border:1px solid #ccc;">
-                {% endif %}
-                {% if processed_b64 %}
-                <h2>Бинаризованное изображение</h2>
-                <img src="{{ processed_b64 }}" style="max-width:45%; height:auto; border:1px solid #ccc;">
-                {% endif %}
-                {% if overlay_b64 %}
-                <h2>Сегментация строк</h2>
-                <img src="{{ overlay_b64 }}" style="max-width:45%; height:auto; border:1px solid #ccc;">
-                {% endif %}
-                <p><a href="{{ url_for('index') }}">Загрузить другое изображение</a> | <a href="{{ url_for('compare') }}">Сравнение</a></p>
-                """,
-                result=result,
-                original_b64=original_b64,
-                processed_b64=processed_b64,
-                overlay_b64=overlay_b64
-            )
-    return render_template_string(
-        """
-        <h1>Детектор подписей</h1>
-        <p>Загрузите изображение рукописного текста или подписи для анализа.</p>
-        <form method="post" enctype="multipart/form-data">
-            <input type="file" name="file" accept="image/*">
-            <input type="submit" value="Анализировать">
-        </form>
-        <p>Или <a href="{{ url_for('compare') }}">перейдите к сравнительному анализу двух изображений</a>.</p>
-        """
-    )
-
-
-if __name__ == '__main__':
-    # Запуск приложения в режиме отладки
-    app.run(debug=True)
+        try:
+            # Вызываем базовый анализ; в отчёте указывается имя файла
+            # пользователя, а не путь во временном каталоге сервера
+            result = basic_analysis.analyze_handwriting(upload.path, display_name=upload.filename)
+        except Exception:
+            _remove_uploads([upload])
+            raise
+        response = Response(stream_with_context(_index_result_stream(result, upload.path)),
+                            mimetype='text/html; charset=utf-8')
+        # Страница отдаётся потоком и читает изображение до последнего
+        # фрагмента, поэтому файл удаляется только после закрытия ответа
+        response.call_on_close(lambda: _remove_uploads([upload]))
+        return response
+    return _INDEX_FORM_TMPL.render()
 
 
 # Новый маршрут для сравнения двух изображений
@@ -138,71 +340,38 @@ def compare():
     сходства и его словесной интерпретации.
     """
     if request.method == 'POST':
-        file_a = request.files.get('file_a')
-        file_b = request.files.get('file_b')
-        if not file_a or not file_b:
+        saved = _save_uploads('file_a', 'file_b')
+        if 'file_a' not in saved or 'file_b' not in saved:
+            _remove_uploads(saved.values())
             return redirect(request.url)
-        if file_a.filename == '' or file_b.filename == '':
-            return redirect(request.url)
-        if allowed_file(file_a.filename) and allowed_file(file_b.filename):
-            filename_a = secure_filename(file_a.filename)
-            filename_b = secure_filename(file_b.filename)
-            path_a = os.path.join(app.config['UPLOAD_FOLDER'], filename_a)
-            path_b = os.path.join(app.config['UPLOAD_FOLDER'], filename_b)
-            file_a.save(path_a)
-            file_b.save(path_b)
+        path_a = saved['file_a'].path
+        path_b = saved['file_b'].path
+        try:
+            similarity, details = comparative.compare_images(path_a, path_b)
+            interpretation = comparative.interpret_similarity(similarity)
+            # Подготовим изображения для вывода
             try:
-                similarity, details = comparative.compare_images(path_a, path_b)
-                interpretation = comparative.interpret_similarity(similarity)
-                # Подготовим изображения для вывода
-                try:
-                    img_a = preprocessing.load_image(path_a)
-                    img_b = preprocessing.load_image(path_b)
-                    img_a_b64 = _image_to_base64(img_a)
-                    img_b_b64 = _image_to_base64(img_b)
-                except Exception:
-                    img_a_b64 = img_b_b64 = ''
-                return render_template_string(
-                    """
-                    <h1>Сравнительный анализ</h1>
-                    <p>Коэффициент сходства: {{ similarity:.2f }}</p>
-                    <p>Интерпретация: {{ interpretation }}</p>
-                    <h2>Исходные изображения</h2>
-                    {% if img_a_b64 %}<img src="{{ img_a_b64 }}" style="max-width:45%; border:1px solid #ccc;">{% endif %}
-                    {% if img_b_b64 %}<img src="{{ img_b_b64 }}" style="max-width:45%; border:1px solid #ccc;">{% endif %}
-                    <h2>Детали</h2>
-                    <ul>
-                        <li>Средний размер букв: {{ details['size_avg'][0]:.1f }} vs {{ details['size_avg'][1]:.1f }}</li>
-                        <li>Разгон между буквами: {{ details['spacing_avg'][0]:.1f }} vs {{ details['spacing_avg'][1]:.1f }}</li>
-                        <li>Наклон: {{ details['slant'][0]:.1f }}° vs {{ details['slant'][1]:.1f }}°</li>
-                        <li>Коэффициент связности: {{ details['connectivity'][0]:.2f }} vs {{ details['connectivity'][1]:.2f }}</li>
-                    </ul>
-                    <a href="{{ url_for('compare') }}">Сравнить другие изображения</a> | <a href="{{ url_for('index') }}">На главную</a>
-                    """,
-                    similarity=similarity,
-                    interpretation=interpretation,
-                    details=details,
-                    img_a_b64=img_a_b64,
-                    img_b_b64=img_b_b64
-                )
-            except Exception as e:
-                return render_template_string(
-                    """
-                    <h1>Ошибка</h1>
-                    <p>{{ error }}</p>
-                    <a href="{{ url_for('compare') }}">Вернуться</a>
-                    """,
-                    error=str(e)
-                )
-    return render_template_string(
-        """
-        <h1>Сравнение двух образцов</h1>
-        <p>Загрузите два изображения (спорный документ и образец) для сравнения.</p>
-        <form method="post" enctype="multipart/form-data">
-            <label>Спорное изображение: <input type="file" name="file_a" accept="image/*"></label><br><br>
-            <label>Образец для сравнения: <input type="file" name="file_b" accept="image/*"></label><br><br>
-            <input type="submit" value="Сравнить">
-        </form>
-        <p><a href="{{ url_for('index') }}">На главную</a></p>
-        """
-    )
\ No newline at end of file
+                img_a_b64 = _image_to_base64(preprocessing.load_preview_cached(path_a))
+                img_b_b64 = _image_to_base64(preprocessing.load_preview_cached(path_b))
+            except Exception:
+                img_a_b64 = img_b_b64 = ''
+            return _COMPARE_RESULT_TMPL.render(
+                similarity=similarity,
+                interpretation=interpretation,
+                details=details,
+                img_a_b64=img_a_b64,
+                img_b_b64=img_b_b64
+            )
+        except Exception as e:
+            return _COMPARE_ERROR_TMPL.render(error=str(e))
+        finally:
+            _remove_uploads(saved.values())
+    return _COMPARE_FORM_TMPL.render()
+
+
+if __name__ == '__main__':
+    # Локальный запуск через многопоточный WSGI-сервер waitress: запросы
+    # обрабатываются параллельно, отладчик и автоперезагрузка отключены.
+    # Для production используйте wsgi.py (см. README).
+    from waitress import serve
+    serve(app, host='127.0.0.1', port=5000, threads=8)
@@ -31,8 +31,6 @@ from datetime import datetime
 
 try:
     from docx import Document
-    from docx.shared import Pt
-    from docx.oxml.ns import qn
     from docx.enum.text import WD_ALIGN_PARAGRAPH
     from docx.shared import Inches
 except ImportError as exc:  # pragma: no cover
@@ -42,13 +40,15 @@ except ImportError as exc:  # pragma: no cover
     ) from exc
 
 
+# Base template whose ``Normal``, ``Heading 1`` and ``Heading 2`` styles are
+# already set to Times New Roman (12, 14 and 12 pt), so individual runs do
+# not need any font formatting.
+TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), 'templates', 'base.docx')
+
+
 def _add_heading(document: Document, text: str, level: int = 1) -> None:
-    """Add a heading to the document with a consistent style."""
-    paragraph = document.add_heading(level=level)
-    run = paragraph.add_run(text)
-    run.font.name = 'Times New Roman'
-    run._element.rPr.rFonts.set(qn('w:eastAsia'), 'Times New Roman')
-    run.font.size = Pt(14 if level == 1 else 12)
+    """Add a heading to the document; the font comes from the template styles."""
+    document.add_heading(text, level=level)
     return None
 
 
@@ -56,10 +56,8 @@ def _add_paragraph(document: Document, text: str, bold: bool = False) -> None:
     """Add a normal paragraph to the document with optional bold text."""
     paragraph = document.add_paragraph()
     run = paragraph.add_run(text)
-    run.font.name = 'Times New Roman'
-    run._element.rPr.rFonts.set(qn('w:eastAsia'), 'Times New Roman')
-    run.font.size = Pt(12)
-    run.bold = bold
+    if bold:
+        run.bold = True
     return None
 
 
@@ -97,7 +95,7 @@ def generate_conclusion(data: Dict[str, Any], output_path: str) -> None:
     -------
     None
     """
-    document = Document()
+    document = Document(TEMPLATE_PATH)
 
     # Title
     _add_heading(document, 'Экспертное заключение', level=1)
@@ -130,13 +128,12 @@ def generate_conclusion(data: Dict[str, Any], output_path: str) -> None:
     # Insert tables (if any)
     tables = data.get('tables', [])
     for table_data in tables:
-        table = document.add_table(rows=1, cols=len(table_data[0]))
+        # Create the table at its final size: add_row() per data row is slow
+        # for large tables
+        table = document.add_table(rows=len(table_data), cols=len(table_data[0]))
         table.style = 'Table Grid'
-        hdr_cells = table.rows[0].cells
-        for i, header in enumerate(table_data[0]):
-            hdr_cells[i].text = header
-        for row_data in table_data[1:]:
-            row_cells = table.add_row().cells
+        for row, row_data in zip(table.rows, table_data):
+            row_cells = row.cells
             for j, cell_val in enumerate(row_data):
                 row_cells[j].text = cell_val
         document.add_paragraph()  # spacing after table
@@ -1,18 +1,43 @@
 """Модульный пакет для детектора подписей.
 
 Каждый модуль в пакете реализует отдельную методику анализа, описанную в "особенной части" Орловой. На первом этапе эти модули содержат только заглушки, чтобы обозначить структуру будущего кода.
+
+Подмодули импортируются лениво (PEP 562) при первом обращении к атрибуту
+пакета, поэтому веб-приложение загружает только те методики, которые
+используются его маршрутами.
 """
 
-from . import preprocessing  # noqa: F401
-from . import basic_analysis  # noqa: F401
-from . import digital  # noqa: F401
-from . import time_gap  # noqa: F401
-from . import similar_handwriting  # noqa: F401
-from . import unusual_conditions  # noqa: F401
-from . import intentional_change  # noqa: F401
-from . import left_hand  # noqa: F401
-from . import print_like  # noqa: F401
-from . import imitation  # noqa: F401
-from . import personality_diagnosis  # noqa: F401
-from . import comparative  # noqa: F401
-from . import general_features  # noqa: F401
\ No newline at end of file
+import importlib
+
+_LAZY_SUBMODULES = {
+    'preprocessing',
+    'basic_analysis',
+    'digital',
+    'time_gap',
+    'similar_handwriting',
+    'unusual_conditions',
+    'intentional_change',
+    'left_hand',
+    'print_like',
+    'imitation',
+    'personality_diagnosis',
+    'comparative',
+    'general_features',
+    'feature_cache',
+}
+
+__all__ = sorted(_LAZY_SUBMODULES)
+
+
+def __getattr__(name: str):
+    """Импортирует подмодуль пакета при первом обращении к нему."""
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module('.' + name, __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Включает ещё не загруженные подмодули в список атрибутов пакета."""
+    return sorted(set(globals()) | _LAZY_SUBMODULES)
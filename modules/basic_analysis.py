@@ -6,12 +6,21 @@
 возвращающая строку с подтверждением обработки изображения.
 """
 
-from typing import Any
-from . import preprocessing
+from bisect import bisect_right
+from typing import Any, Optional
+from . import feature_cache
 from . import general_features
 
 
-def analyze_handwriting(image_path: str) -> str:
+# Границы категорий размера букв и разгона (пороговые значения могут
+# корректироваться); категории упорядочены по возрастанию величины
+_SIZE_THRESHOLDS = (15, 30)
+_SIZE_CATEGORIES = ('малый', 'средний', 'крупный')
+_SPACING_THRESHOLDS = (3, 7)
+_SPACING_CATEGORIES = ('узкий', 'средний', 'широкий')
+
+
+def analyze_handwriting(image_path: str, *, display_name: Optional[str] = None) -> str:
     """Проводит базовый анализ изображения рукописного текста.
 
     Выполняет следующие операции:
@@ -22,41 +31,30 @@ def analyze_handwriting(image_path: str) -> str:
     Результат возвращается в виде текстового отчёта.
 
     :param image_path: путь к файлу изображения
+    :param display_name: имя изображения для отчёта (например, имя файла,
+        под которым его загрузил пользователь); по умолчанию — ``image_path``
     :return: текстовый отчёт о результатах анализа
     """
+    if display_name is None:
+        display_name = image_path
     try:
-        image = preprocessing.load_image(image_path)
+        # Предобработка, сегментация строк и общие признаки (из общего кэша)
+        features = feature_cache.feature_bundle(image_path)
     except FileNotFoundError as exc:
         return str(exc)
-
-    processed = preprocessing.preprocess_image(image)
-    # Сегментация строк
-    lines = preprocessing.segment_text(processed)
-    num_lines = len(lines)
+    num_lines = features['num_lines']
     if num_lines == 0:
         return (
-            f"Обработано изображение: {image_path}. Текст на изображении не обнаружен. "
+            f"Обработано изображение: {display_name}. Текст на изображении не обнаружен. "
             "Пожалуйста, убедитесь, что файл содержит рукописный текст."
         )
-    # Общие признаки
-    avg_height, std_height = general_features.compute_letter_sizes(processed)
-    spacing_mean, spacing_std = general_features.compute_spacing(processed)
-    slant_angle = general_features.compute_slant(processed)
-    connectivity = general_features.compute_connectivity(processed)
-    # Категории размера письма (пороговые значения могут корректироваться)
-    if avg_height < 15:
-        size_category = 'малый'
-    elif avg_height < 30:
-        size_category = 'средний'
-    else:
-        size_category = 'крупный'
-    # Категории разгона (простые пороги)
-    if spacing_mean < 3:
-        spacing_category = 'узкий'
-    elif spacing_mean < 7:
-        spacing_category = 'средний'
-    else:
-        spacing_category = 'широкий'
+    avg_height, std_height = features['size_mean'], features['size_std']
+    spacing_mean, spacing_std = features['spacing_mean'], features['spacing_std']
+    slant_angle = features['slant']
+    connectivity = features['connectivity']
+    # Категории размера письма и разгона
+    size_category = _SIZE_CATEGORIES[bisect_right(_SIZE_THRESHOLDS, avg_height)]
+    spacing_category = _SPACING_CATEGORIES[bisect_right(_SPACING_THRESHOLDS, spacing_mean)]
     # Наклон: положительный — правый, отрицательный — левый, около нуля — прямой
     if slant_angle > 5:
         slant_category = 'правый'
@@ -68,7 +66,7 @@ def analyze_handwriting(image_path: str) -> str:
     skill = general_features.assess_skill_level(std_height, spacing_std, [])
     # Формируем отчёт
     report_lines = [
-        f"Изображение: {image_path}",
+        f"Изображение: {display_name}",
         f"Количество строк: {num_lines}",
         f"Средний размер букв: {avg_height:.1f} пикселей ({size_category})",
         f"Стандартное отклонение размера: {std_height:.1f} пикселей",
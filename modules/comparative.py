@@ -7,19 +7,28 @@
 этапах.
 """
 
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Tuple
-from . import preprocessing, general_features
+from . import feature_cache
 import numpy as np
 
 
+# Границы категорий размера букв (малый / средний / крупный), пиксели
+_SIZE_THRESHOLDS = (15, 30)
+
+# Границы коэффициента сходства и соответствующие словесные выводы
+_SIMILARITY_THRESHOLDS = (0.5, 0.75)
+_SIMILARITY_VERDICTS = (
+    'низкая степень сходства (вероятно, разные исполнители)',
+    'умеренная степень сходства (необходимо дополнительное исследование)',
+    'высокая степень сходства (возможно, выполнял один исполнитель)',
+)
+
+
 def _categorize_size(avg_height: float) -> int:
     """Категоризация размера букв: 0 – малый, 1 – средний, 2 – крупный."""
-    if avg_height < 15:
-        return 0
-    elif avg_height < 30:
-        return 1
-    else:
-        return 2
+    return bisect_right(_SIZE_THRESHOLDS, avg_height)
 
 
 def compare_images(image_path_a: str, image_path_b: str) -> Tuple[float, Dict[str, Tuple[float, float]]]:
@@ -34,21 +43,17 @@ def compare_images(image_path_a: str, image_path_b: str) -> Tuple[float, Dict[st
     :param image_path_b: путь к второму изображению (образец для сравнения)
     :return: (коэффициент сходства, словарь отличий по признакам)
     """
-    # Загружаем и обрабатываем изображения
-    img_a = preprocessing.load_image(image_path_a)
-    img_b = preprocessing.load_image(image_path_b)
-    proc_a = preprocessing.preprocess_image(img_a)
-    proc_b = preprocessing.preprocess_image(img_b)
-    # Извлекаем общие признаки
-    size_a, size_std_a = general_features.compute_letter_sizes(proc_a)
-    space_a, space_std_a = general_features.compute_spacing(proc_a)
-    slant_a = general_features.compute_slant(proc_a)
-    conn_a = general_features.compute_connectivity(proc_a)
-
-    size_b, size_std_b = general_features.compute_letter_sizes(proc_b)
-    space_b, space_std_b = general_features.compute_spacing(proc_b)
-    slant_b = general_features.compute_slant(proc_b)
-    conn_b = general_features.compute_connectivity(proc_b)
+    # Изображения независимы: обрабатываем их параллельно (OpenCV и NumPy
+    # освобождают GIL на время вычислений)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future_a = executor.submit(feature_cache.feature_bundle, image_path_a)
+        future_b = executor.submit(feature_cache.feature_bundle, image_path_b)
+        features_a = future_a.result()
+        features_b = future_b.result()
+    size_a, size_b = features_a['size_mean'], features_b['size_mean']
+    space_a, space_b = features_a['spacing_mean'], features_b['spacing_mean']
+    slant_a, slant_b = features_a['slant'], features_b['slant']
+    conn_a, conn_b = features_a['connectivity'], features_b['connectivity']
     # Сохраняем подробности
     details = {
         'size_avg': (size_a, size_b),
@@ -59,20 +64,15 @@ def compare_images(image_path_a: str, image_path_b: str) -> Tuple[float, Dict[st
     # Категоризация размера
     cat_a = _categorize_size(size_a)
     cat_b = _categorize_size(size_b)
-    diff_cat = abs(cat_a - cat_b)
-    score_size = 1.0 - min(diff_cat / 2.0, 1.0)
-    # Разгон (интервал) – нормируем разницу относительно среднего величины
-    max_space = max(space_a, space_b, 1e-3)
-    diff_space = abs(space_a - space_b) / max_space
-    score_spacing = 1.0 - min(diff_space, 1.0)
-    # Наклон – нормируем на 90°
-    diff_slant = abs(slant_a - slant_b) / 90.0
-    score_slant = 1.0 - min(diff_slant, 1.0)
-    # Связность – разница абсолютная
-    diff_conn = abs(conn_a - conn_b)
-    score_conn = 1.0 - min(diff_conn, 1.0)
+    # Различия признаков нормируются на масштаб каждого признака:
+    # категория размера – на 2, разгон – на большее из средних значений,
+    # наклон – на 90°, связность сравнивается по абсолютной разнице
+    values_a = np.array([cat_a, space_a, slant_a, conn_a], dtype=np.float64)
+    values_b = np.array([cat_b, space_b, slant_b, conn_b], dtype=np.float64)
+    scale = np.array([2.0, max(space_a, space_b, 1e-3), 90.0, 1.0])
+    scores = 1.0 - np.minimum(np.abs(values_a - values_b) / scale, 1.0)
     # Итоговый коэффициент – среднее
-    similarity = (score_size + score_spacing + score_slant + score_conn) / 4.0
+    similarity = float(scores.mean())
     return similarity, details
 
 
@@ -82,9 +82,4 @@ def interpret_similarity(similarity: float) -> str:
     :param similarity: коэффициент (0–1)
     :return: словесный вывод
     """
-    if similarity >= 0.75:
-        return 'высокая степень сходства (возможно, выполнял один исполнитель)'
-    elif similarity >= 0.5:
-        return 'умеренная степень сходства (необходимо дополнительное исследование)'
-    else:
-        return 'низкая степень сходства (вероятно, разные исполнители)'
\ No newline at end of file
+    return _SIMILARITY_VERDICTS[bisect_right(_SIMILARITY_THRESHOLDS, similarity)]
\ No newline at end of file
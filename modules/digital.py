@@ -6,16 +6,15 @@
 количества и интервалов между ними.
 """
 
-from typing import List
 import cv2
 import numpy as np
-from . import preprocessing, general_features
+from . import preprocessing, feature_cache
 
 
 def analyze_digits(image_path: str) -> str:
     """Проводит анализ цифрового почерка.
 
-    Изображение бинаризуется, выделяются контуры. Для каждой
+    Изображение бинаризуется, выделяются связные компоненты. Для каждой
     предполагаемой цифры оценивается высота, ширина и пропорции. По
     совокупности вычисляется средний размер, разброс, соотношение
     сторон и количество цифр. Используются функции общего модуля для
@@ -25,27 +24,20 @@ def analyze_digits(image_path: str) -> str:
     :return: текстовый отчёт о цифровом почерке
     """
     try:
-        image = preprocessing.load_image(image_path)
+        proc, components, _ = preprocessing.preprocess_bundle_cached(image_path)
     except FileNotFoundError as exc:
         return str(exc)
-    proc = preprocessing.preprocess_image(image)
-    # Находим контуры
-    contours, _ = cv2.findContours(proc, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-    digit_heights: List[int] = []
-    aspect_ratios: List[float] = []
-    for cnt in contours:
-        area = cv2.contourArea(cnt)
-        if area < 20:
-            continue  # пропускаем шум
-        x, y, w, h = cv2.boundingRect(cnt)
-        if h == 0:
-            continue
-        aspect = w / h
-        # Ограничиваем допустимые пропорции цифр
-        if 0.2 < aspect < 1.5:
-            digit_heights.append(h)
-            aspect_ratios.append(aspect)
-    if not digit_heights:
+    # Статистика связных компонент (x, y, ширина, высота, площадь) сразу
+    # для всех элементов, без строки фона
+    heights = components[:, cv2.CC_STAT_HEIGHT]
+    areas = components[:, cv2.CC_STAT_AREA]
+    # Высота компоненты всегда не меньше 1 пикселя
+    aspects = components[:, cv2.CC_STAT_WIDTH] / heights
+    # Пропускаем шум и ограничиваем допустимые пропорции цифр
+    keep = (areas >= 20) & (aspects > 0.2) & (aspects < 1.5)
+    digit_heights = heights[keep]
+    aspect_ratios = aspects[keep]
+    if digit_heights.size == 0:
         return (
             f"Цифровых компонентов не обнаружено на изображении: {image_path}. "
             "Убедитесь, что файл содержит цифры."
@@ -53,9 +45,10 @@ def analyze_digits(image_path: str) -> str:
     avg_height = float(np.mean(digit_heights))
     std_height = float(np.std(digit_heights))
     avg_aspect = float(np.mean(aspect_ratios))
-    count_digits = len(digit_heights)
-    spacing_mean, spacing_std = general_features.compute_spacing(proc)
-    slant = general_features.compute_slant(proc)
+    count_digits = int(digit_heights.size)
+    features = feature_cache.feature_bundle(image_path)
+    spacing_mean = features['spacing_mean']
+    slant = features['slant']
     report_lines = [
         f"Анализ цифрового почерка ({image_path})",
         f"Количество цифр: {count_digits}",
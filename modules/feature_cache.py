@@ -0,0 +1,69 @@
+"""Общий кэш признаков почерка для файлов изображений.
+
+Разные методики (маскировка, необычные условия, левая рука, печатное
+письмо, диагностика личности, разрыв во времени) используют одни и те же
+общие признаки одного и того же изображения. Здесь они вычисляются один
+раз для каждого содержимого файла, а модули анализа лишь формируют выводы.
+"""
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
+import numpy as np
+from . import preprocessing, general_features
+
+
+@lru_cache(maxsize=64)
+def _cached_features(key: preprocessing.FileKey) -> Mapping[str, Any]:
+    """Кэшируемый расчёт признаков (ключ — содержимое файла)."""
+    proc = preprocessing.preprocess_image_cached(key.path)
+    starts, _ = preprocessing.text_line_bounds(proc)
+    return MappingProxyType({
+        **general_features.analyze_all(proc),
+        'num_lines': len(starts),
+    })
+
+
+@lru_cache(maxsize=64)
+def _cached_line_features(key: preprocessing.FileKey) -> np.ndarray:
+    """Кэшируемый расчёт признаков отдельных строк."""
+    lines = preprocessing.segment_text(preprocessing.preprocess_image_cached(key.path))
+    # Признаки строк: размер, интервал, наклон (по строке на признак)
+    features = np.empty((3, len(lines)), dtype=np.float64)
+    for idx, line_img in enumerate(lines):
+        features[0, idx], _ = general_features.compute_letter_sizes(line_img)
+        features[1, idx], _ = general_features.compute_spacing(line_img)
+        features[2, idx] = general_features.compute_slant(line_img)
+    features.setflags(write=False)
+    return features
+
+
+def feature_bundle(path: str) -> Mapping[str, Any]:
+    """Возвращает общие признаки изображения, вычисляя их не более одного раза.
+
+    Признаки всего изображения совпадают с результатом
+    :func:`general_features.analyze_all` для его бинаризованной версии.
+    Результат неизменяем и общий для всех вызывающих.
+
+    :param path: путь к файлу изображения
+    :return: отображение с ключами ``size_mean``, ``size_std``,
+        ``spacing_mean``, ``spacing_std``, ``slant``, ``connectivity`` и
+        ``num_lines`` (число строк текста)
+    :raises FileNotFoundError: если файл не удалось загрузить
+    """
+    return _cached_features(preprocessing.file_cache_key(path))
+
+
+def line_features(path: str) -> np.ndarray:
+    """Возвращает признаки каждой строки текста изображения.
+
+    Строки вырезаются и измеряются по отдельности, что заметно дороже
+    признаков всего изображения, поэтому они вычисляются отдельно и только
+    для методик, которым нужен их разброс.
+
+    :param path: путь к файлу изображения
+    :return: массив 3×N (только для чтения) с размером, интервалом и
+        наклоном каждой из N строк
+    :raises FileNotFoundError: если файл не удалось загрузить
+    """
+    return _cached_line_features(preprocessing.file_cache_key(path))
@@ -4,27 +4,174 @@
 характеристик почерка без привлечения методов машинного обучения.
 """
 
-from typing import Dict, List, Tuple
+from bisect import bisect_right
+from functools import wraps
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
+import weakref
 import cv2
 import numpy as np
+from . import preprocessing
 
 
-def _find_components(binary_image: np.ndarray, min_area: int = 10) -> List[np.ndarray]:
+# Результаты вычислений для неизменяемых массивов: ключ — (имя функции, id массива)
+_ARRAY_MEMO: Dict[Tuple[str, int], Any] = {}
+
+
+def _memoize_on_array(func: Callable) -> Callable:
+    """Кэширует результат функции признака для неизменяемого массива.
+
+    Кэш используется только для массивов, которые владеют своими данными
+    и помечены как доступные лишь для чтения (например, результатов
+    :func:`preprocessing.preprocess_image_cached`), и только при вызове без
+    дополнительных аргументов. Представления (срезы) чужих буферов не
+    кэшируются: исходный буфер может оставаться изменяемым. Запись
+    удаляется при уничтожении массива, поэтому повторное использование
+    ``id`` не приводит к выдаче чужого результата. Результаты,
+    возвращаемые из кэша, неизменяемы (кортежи, массивы только для
+    чтения, ``MappingProxyType``), так как их получают все вызывающие.
+    """
+    @wraps(func)
+    def wrapper(binary_image: np.ndarray, *args, **kwargs):
+        if args or kwargs or binary_image.flags.writeable or not binary_image.flags.owndata:
+            return func(binary_image, *args, **kwargs)
+        key = (func.__name__, id(binary_image))
+        if key not in _ARRAY_MEMO:
+            _ARRAY_MEMO[key] = func(binary_image)
+            weakref.finalize(binary_image, _ARRAY_MEMO.pop, key, None)
+        return _ARRAY_MEMO[key]
+    return wrapper
+
+
+@_memoize_on_array
+def _find_components(binary_image: np.ndarray, min_area: int = 10) -> Tuple[np.ndarray, ...]:
     """Выделяет контуры (связные компоненты) на бинарном изображении.
 
     Функция использует `cv2.findContours` и фильтрует очень маленькие
-    компоненты по площади (скорее всего это шум). Возвращает список
-    контуров.
+    компоненты по площади (скорее всего это шум). Возвращает кортеж
+    контуров. Для неизменяемых изображений контуры ищутся один раз, даже
+    если признаки вычисляются отдельными вызовами.
 
     :param binary_image: бинарное изображение (буквы — белые пиксели)
     :param min_area: минимальная площадь компонента для включения
-    :return: список контуров
+    :return: кортеж контуров
     """
     contours, _ = cv2.findContours(binary_image, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-    filtered = [cnt for cnt in contours if cv2.contourArea(cnt) >= min_area]
-    return filtered
+    return tuple(cnt for cnt in contours if cv2.contourArea(cnt) >= min_area)
+
+
+@_memoize_on_array
+def _component_stats(binary_image: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Статистика связных компонент (см. :func:`preprocessing.component_stats`)."""
+    return preprocessing.component_stats(binary_image)
+
 
+def _letter_sizes(stats: np.ndarray, min_area: int = 10) -> Tuple[float, float]:
+    """Средняя высота и её стандартное отклонение по статистике компонент.
 
+    Компоненты площадью меньше ``min_area`` пикселей считаются шумом.
+    """
+    heights = stats[stats[:, cv2.CC_STAT_AREA] >= min_area, cv2.CC_STAT_HEIGHT]
+    if heights.size == 0:
+        return 0.0, 0.0
+    return float(np.mean(heights)), float(np.std(heights))
+
+
+def _slant(contours: Sequence[np.ndarray]) -> float:
+    """Средний угол наклона эллипсов, построенных по контурам."""
+    angles = np.empty(len(contours), dtype=np.float64)
+    count = 0
+    for cnt in contours:
+        if len(cnt) < 5:
+            continue  # fitEllipse требует минимум 5 точек
+        # угол относительно горизонтали (0-180)
+        angles[count] = cv2.fitEllipse(cnt)[2]
+        count += 1
+    if count == 0:
+        return 0.0
+    angles = angles[:count]
+    # Преобразуем в диапазон [-90, 90]
+    return float(np.mean(np.where(angles > 90, angles - 180, angles)))
+
+
+@_memoize_on_array
+def _text_rows(binary_image: np.ndarray) -> np.ndarray:
+    """Индексы рядов пикселей, относящихся к строкам текста.
+
+    Ряд считается текстовым, если число белых пикселей в нём превышает
+    10 % от максимума горизонтальной проекции. Для неизменяемых
+    изображений результат вычисляется один раз и используется всеми
+    признаками.
+    """
+    rows_sum = preprocessing.row_projection(binary_image)
+    max_val = rows_sum.max() if rows_sum.size > 0 else 0
+    threshold = 0.1 * max_val if max_val > 0 else 0
+    text_rows = np.flatnonzero(rows_sum > threshold)
+    text_rows.setflags(write=False)
+    return text_rows
+
+
+def _spacing(mask: np.ndarray) -> Tuple[float, float]:
+    """Среднее и стандартное отклонение интервалов по маске текстовых рядов.
+
+    Все ряды обрабатываются одновременно: белые пиксели каждого ряда
+    объединяются в отрезки (по переходам 0→1 и 1→0), а интервал — это
+    число чёрных пикселей между концом отрезка и началом следующего
+    отрезка того же ряда.
+
+    :param mask: маска белых пикселей текстовых рядов, дополненная чёрным
+        столбцом с каждой стороны
+    """
+    transitions = np.diff(mask.view(np.int8), axis=1)
+    start_rows, start_cols = np.nonzero(transitions == 1)
+    end_rows, end_cols = np.nonzero(transitions == -1)
+    # Интервалы между соседними отрезками одного ряда
+    same_row = start_rows[1:] == end_rows[:-1]
+    gaps = (start_cols[1:] - end_cols[:-1])[same_row]
+    if gaps.size == 0:
+        return 0.0, 0.0
+    return float(np.mean(gaps)), float(np.std(gaps))
+
+
+def _connectivity(mask: np.ndarray) -> float:
+    """Доля слитных переходов между белыми пикселями по маске текстовых рядов.
+
+    Переходом считается пара соседних (в порядке следования) белых
+    пикселей одного ряда; слитным — переход между пикселями, стоящими
+    вплотную. В ряду из ``n`` белых пикселей ``n - 1`` переходов, поэтому
+    обе величины получаются подсчётом пикселей без цикла по рядам.
+
+    :param mask: маска белых пикселей текстовых рядов
+    """
+    pixels_per_row = np.count_nonzero(mask, axis=1)
+    possible = int(pixels_per_row.sum()) - int(np.count_nonzero(pixels_per_row))
+    if possible == 0:
+        return 0.0
+    connections = int(np.count_nonzero(mask[:, 1:] & mask[:, :-1]))
+    return connections / possible
+
+
+@_memoize_on_array
+def _row_gap_stats(binary_image: np.ndarray) -> Tuple[float, float, float]:
+    """Интервалы и связность в текстовых рядах по одной общей маске.
+
+    Маска текстовых рядов строится один раз и используется как для
+    интервалов, так и для доли слитных переходов.
+
+    :param binary_image: бинарное изображение (буквы — белые пиксели)
+    :return: (средний интервал, стандартное отклонение интервалов,
+        доля слитных переходов)
+    """
+    text_rows = _text_rows(binary_image)
+    if text_rows.size == 0:
+        return 0.0, 0.0, 0.0
+    # Добавляем по чёрному столбцу с каждой стороны, чтобы каждый отрезок
+    # имел и начало, и конец; на подсчёт переходов это не влияет
+    mask = np.pad(binary_image[text_rows] > 0, ((0, 0), (1, 1)))
+    return _spacing(mask) + (_connectivity(mask),)
+
+
+@_memoize_on_array
 def compute_letter_sizes(binary_image: np.ndarray) -> Tuple[float, float]:
     """Вычисляет среднюю и стандартную высоту буквенных элементов.
 
@@ -35,17 +182,11 @@ def compute_letter_sizes(binary_image: np.ndarray) -> Tuple[float, float]:
     :param binary_image: бинарное изображение (буквы — белые пиксели)
     :return: (средняя высота, стандартное отклонение)
     """
-    contours = _find_components(binary_image)
-    heights = []
-    for cnt in contours:
-        x, y, w, h = cv2.boundingRect(cnt)
-        heights.append(h)
-    if not heights:
-        return 0.0, 0.0
-    heights_arr = np.array(heights)
-    return float(np.mean(heights_arr)), float(np.std(heights_arr))
+    stats, _ = _component_stats(binary_image)
+    return _letter_sizes(stats)
 
 
+@_memoize_on_array
 def compute_spacing(binary_image: np.ndarray) -> Tuple[float, float]:
     """Оценивает средние расстояния между компонентами в строке.
 
@@ -56,31 +197,11 @@ def compute_spacing(binary_image: np.ndarray) -> Tuple[float, float]:
     :param binary_image: бинарное изображение (буквы — белые пиксели)
     :return: (среднее расстояние, стандартное отклонение)
     """
-    # Находим проекции на горизонтальную ось
-    rows_sum = np.sum(binary_image // 255, axis=1)
-    # Определяем строки с текстом
-    threshold = 0.1 * rows_sum.max() if rows_sum.max() > 0 else 0
-    text_rows = np.where(rows_sum > threshold)[0]
-    if text_rows.size == 0:
-        return 0.0, 0.0
-    spacings: List[int] = []
-    # Для каждой строки текста вычисляем интервалы между белыми блоками
-    for row in text_rows:
-        line = binary_image[row]
-        positions = np.where(line > 0)[0]
-        if positions.size == 0:
-            continue
-        # Разрывы между соседними белыми пикселями больше 1 означают интервал
-        gaps = np.diff(positions)
-        # Считаем только большие промежутки (более 1 пикселя)
-        large_gaps = gaps[gaps > 1] - 1
-        spacings.extend(large_gaps.tolist())
-    if not spacings:
-        return 0.0, 0.0
-    arr = np.array(spacings)
-    return float(np.mean(arr)), float(np.std(arr))
+    spacing_mean, spacing_std, _ = _row_gap_stats(binary_image)
+    return spacing_mean, spacing_std
 
 
+@_memoize_on_array
 def compute_slant(binary_image: np.ndarray) -> float:
     """Вычисляет средний угол наклона компонентов.
 
@@ -92,22 +213,10 @@ def compute_slant(binary_image: np.ndarray) -> float:
     :param binary_image: бинарное изображение (буквы — белые пиксели)
     :return: средний угол наклона (градусы)
     """
-    contours = _find_components(binary_image)
-    angles = []
-    for cnt in contours:
-        if len(cnt) < 5:
-            continue  # fitEllipse требует минимум 5 точек
-        ellipse = cv2.fitEllipse(cnt)
-        angle = ellipse[2]  # угол относительно горизонтали (0-180)
-        # Преобразуем в диапазон [-90, 90]
-        if angle > 90:
-            angle -= 180
-        angles.append(angle)
-    if not angles:
-        return 0.0
-    return float(np.mean(angles))
+    return _slant(_find_components(binary_image))
 
 
+@_memoize_on_array
 def compute_connectivity(binary_image: np.ndarray) -> float:
     """Вычисляет коэффициент связности письма.
 
@@ -119,33 +228,50 @@ def compute_connectivity(binary_image: np.ndarray) -> float:
     :param binary_image: бинарное изображение (буквы — белые пиксели)
     :return: коэффициент связности (0.0–1.0)
     """
-    # Проекция строк
-    rows_sum = np.sum(binary_image // 255, axis=1)
-    threshold = 0.1 * rows_sum.max() if rows_sum.max() > 0 else 0
-    text_rows = np.where(rows_sum > threshold)[0]
-    if text_rows.size == 0:
+    if _text_rows(binary_image).size == 0:
         return 0.0
     # средняя высота компоненты
     _, h_std = compute_letter_sizes(binary_image)
     # Если нет компонентов, вернем 0
     if h_std == 0:
         return 0.0
-    connections = 0
-    possible = 0
-    for row in text_rows:
-        line = binary_image[row]
-        positions = np.where(line > 0)[0]
-        if positions.size == 0:
-            continue
-        gaps = np.diff(positions)
-        # интервал между буквами – у величина > 1
-        for gap in gaps:
-            possible += 1
-            if gap <= 1:
-                connections += 1
-    if possible == 0:
-        return 0.0
-    return connections / possible
+    return _row_gap_stats(binary_image)[2]
+
+
+@_memoize_on_array
+def analyze_all(binary_image: np.ndarray) -> Mapping[str, float]:
+    """Вычисляет все общие признаки почерка за один проход.
+
+    Эквивалентно последовательному вызову :func:`compute_letter_sizes`,
+    :func:`compute_spacing`, :func:`compute_slant` и
+    :func:`compute_connectivity`, но разметка компонент, поиск контуров,
+    горизонтальная проекция и маска текстовых рядов вычисляются по одному
+    разу и используются всеми признаками.
+
+    :param binary_image: бинарное изображение (буквы — белые пиксели)
+    :return: неизменяемое отображение с ключами ``size_mean``, ``size_std``,
+        ``spacing_mean``, ``spacing_std``, ``slant``, ``connectivity``
+    """
+    stats, _ = _component_stats(binary_image)
+    size_mean, size_std = _letter_sizes(stats)
+    spacing_mean, spacing_std, connectivity = _row_gap_stats(binary_image)
+    # Без текстовых рядов связность уже равна нулю; при одинаковых
+    # размерах компонент она не оценивается (как в compute_connectivity)
+    if size_std == 0:
+        connectivity = 0.0
+    return MappingProxyType({
+        'size_mean': size_mean,
+        'size_std': size_std,
+        'spacing_mean': spacing_mean,
+        'spacing_std': spacing_std,
+        'slant': _slant(_find_components(binary_image)),
+        'connectivity': connectivity,
+    })
+
+
+# Пороги суммарной вариативности и соответствующие степени выработанности
+_SKILL_THRESHOLDS = (5, 15)
+_SKILL_LEVELS = ('высокая', 'средняя', 'низкая')
 
 
 def assess_skill_level(size_std: float, spacing_std: float, slant_values: List[float]) -> str:
@@ -170,9 +296,4 @@ def assess_skill_level(size_std: float, spacing_std: float, slant_values: List[f
         slant_std = float(np.std(np.array(slant_values)))
         variation += slant_std
     # Эмпирические пороги могут быть настроены после тестирования
-    if variation < 5:
-        return 'высокая'
-    elif variation < 15:
-        return 'средняя'
-    else:
-        return 'низкая'
\ No newline at end of file
+    return _SKILL_LEVELS[bisect_right(_SKILL_THRESHOLDS, variation)]
\ No newline at end of file
@@ -7,12 +7,22 @@
 предположение о возможной имитации.
 """
 
-from typing import List
+from bisect import bisect_left
 import cv2
 import numpy as np
 from . import preprocessing
 
 
+# Пороги средней компактности и выводы в порядке её возрастания:
+# высокие значения (>10) могут указывать на дрожание
+_COMPACTNESS_THRESHOLDS = (6, 10)
+_VERDICTS = (
+    'признаков подражания не обнаружено',
+    'возможны признаки подражания',
+    'признаки подражания (возможно, письмо обведено/сильно замедлено)',
+)
+
+
 def analyze_imitation(image_path: str) -> str:
     """Оценивает признаки подражания чужому почерку.
 
@@ -20,31 +30,22 @@ def analyze_imitation(image_path: str) -> str:
     :return: текстовый отчёт о вероятности подражания
     """
     try:
-        image = preprocessing.load_image(image_path)
+        proc = preprocessing.preprocess_image_cached(image_path)
     except FileNotFoundError as exc:
         return str(exc)
-    proc = preprocessing.preprocess_image(image)
     contours, _ = cv2.findContours(proc, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-    compactness_values: List[float] = []
-    for cnt in contours:
-        area = cv2.contourArea(cnt)
-        if area < 20:
-            continue
-        perimeter = cv2.arcLength(cnt, True)
-        if area == 0:
-            continue
-        compactness = (perimeter ** 2) / (4 * np.pi * area)
-        compactness_values.append(compactness)
-    if not compactness_values:
+    n = len(contours)
+    areas = np.fromiter((cv2.contourArea(cnt) for cnt in contours), dtype=np.float64, count=n)
+    perimeters = np.fromiter((cv2.arcLength(cnt, True) for cnt in contours), dtype=np.float64, count=n)
+    # Мелкие контуры (площадь < 20) считаются шумом; это же условие
+    # исключает деление на нулевую площадь
+    keep = areas >= 20
+    compactness_values = perimeters[keep] ** 2 / (4 * np.pi * areas[keep])
+    if compactness_values.size == 0:
         return f"На изображении {image_path} не найдено элементов для анализа имитации."
     mean_compactness = float(np.mean(compactness_values))
-    # Оценка: высокие значения компактности (>10) могут указывать на дрожание
-    if mean_compactness > 10:
-        verdict = 'признаки подражания (возможно, письмо обведено/сильно замедлено)'
-    elif mean_compactness > 6:
-        verdict = 'возможны признаки подражания'
-    else:
-        verdict = 'признаков подражания не обнаружено'
+    # bisect_left: значение, равное порогу, относится к нижней категории
+    verdict = _VERDICTS[bisect_left(_COMPACTNESS_THRESHOLDS, mean_compactness)]
     report = (
         f"Анализ подражания ({image_path}):\n"
         f"Средняя компактность штрихов: {mean_compactness:.1f}\n"
@@ -7,9 +7,19 @@
 вероятность маскировки.
 """
 
-from typing import List
+from bisect import bisect_left
 import numpy as np
-from . import preprocessing, general_features
+from . import feature_cache
+
+
+# Пороговые значения суммарной вариативности эмпирические; при
+# тестировании могут быть уточнены. Выводы — в порядке её возрастания
+_VARIATION_THRESHOLDS = (10, 20)
+_VERDICTS = (
+    'признаков маскировки не обнаружено',
+    'возможны признаки маскировки',
+    'выраженные признаки маскировки почерка',
+)
 
 
 def analyze_intentional_change(image_path: str) -> str:
@@ -19,37 +29,18 @@ def analyze_intentional_change(image_path: str) -> str:
     :return: отчёт со статистикой и выводом о маскировке
     """
     try:
-        image = preprocessing.load_image(image_path)
+        line_features = feature_cache.line_features(image_path)
     except FileNotFoundError as exc:
         return str(exc)
-    proc = preprocessing.preprocess_image(image)
-    lines = preprocessing.segment_text(proc)
-    if not lines:
+    if line_features.shape[1] == 0:
         return (
             f"Не удалось обнаружить текст на изображении {image_path} для анализа маскировки."
         )
-    sizes: List[float] = []
-    spacings: List[float] = []
-    slants: List[float] = []
-    for line_img in lines:
-        size, _ = general_features.compute_letter_sizes(line_img)
-        spacing, _ = general_features.compute_spacing(line_img)
-        slant = general_features.compute_slant(line_img)
-        sizes.append(size)
-        spacings.append(spacing)
-        slants.append(slant)
     # Вычисляем разбросы
-    size_std = float(np.std(np.array(sizes)))
-    spacing_std = float(np.std(np.array(spacings)))
-    slant_std = float(np.std(np.array(slants)))
+    size_std, spacing_std, slant_std = (float(std) for std in np.std(line_features, axis=1))
     variation = size_std + spacing_std + slant_std
-    # Пороговые значения эмпирические; при тестировании могут быть уточнены
-    if variation > 20:
-        verdict = 'выраженные признаки маскировки почерка'
-    elif variation > 10:
-        verdict = 'возможны признаки маскировки'
-    else:
-        verdict = 'признаков маскировки не обнаружено'
+    # bisect_left: значение, равное порогу, относится к нижней категории
+    verdict = _VERDICTS[bisect_left(_VARIATION_THRESHOLDS, variation)]
     report = (
         f"Анализ маскированного почерка ({image_path}):\n"
         f"Стандартное отклонение размера строк: {size_std:.1f}\n"
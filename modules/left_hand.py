@@ -5,7 +5,7 @@
 определять доминирующий наклон и оценивать связность.
 """
 
-from . import preprocessing, general_features
+from . import feature_cache
 
 
 def analyze_left_hand(image_path: str) -> str:
@@ -15,12 +15,11 @@ def analyze_left_hand(image_path: str) -> str:
     :return: отчёт с оценкой вероятности левой руки
     """
     try:
-        image = preprocessing.load_image(image_path)
+        features = feature_cache.feature_bundle(image_path)
     except FileNotFoundError as exc:
         return str(exc)
-    proc = preprocessing.preprocess_image(image)
-    slant = general_features.compute_slant(proc)
-    connectivity = general_features.compute_connectivity(proc)
+    slant = features['slant']
+    connectivity = features['connectivity']
     # Простая эвристика: наклон < -10° указывает на левый наклон (вероятно левая рука)
     # При этом низкая связность (<0.3) усиливает подозрение
     if slant < -10 and connectivity < 0.3:
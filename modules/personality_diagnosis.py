@@ -7,7 +7,7 @@
 точностью и служат лишь демонстрацией подхода.
 """
 
-from . import preprocessing, general_features
+from . import feature_cache
 
 
 def analyze_personality(image_path: str) -> str:
@@ -17,13 +17,12 @@ def analyze_personality(image_path: str) -> str:
     :return: текстовый отчёт с вероятностной оценкой
     """
     try:
-        image = preprocessing.load_image(image_path)
+        features = feature_cache.feature_bundle(image_path)
     except FileNotFoundError as exc:
         return str(exc)
-    proc = preprocessing.preprocess_image(image)
-    size, _ = general_features.compute_letter_sizes(proc)
-    spacing, _ = general_features.compute_spacing(proc)
-    slant = general_features.compute_slant(proc)
+    size = features['size_mean']
+    spacing = features['spacing_mean']
+    slant = features['slant']
     # Эвристики: крупный размер и широкий разгон встречаются чаще у мужчин,
     # мелкий размер и узкий разгон – у женщин. Наклон вправо характерен для
     # динамичного письма (молодой/средний возраст), наклон менее выражен у
@@ -6,7 +6,10 @@
 заглушки, возвращающие неизменённый объект.
 """
 
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List, NamedTuple, Tuple
+import hashlib
+import os
 import cv2
 import numpy as np
 
@@ -25,6 +28,177 @@ def load_image(path: str) -> np.ndarray:
     return image
 
 
+# Ширина уменьшенной копии исходного изображения, которая хранится в кэше
+# вместо оригинала: для вывода на страницу большего не требуется
+PREVIEW_WIDTH = 800
+
+# Число файлов, для которых хранятся результаты загрузки. Каждая запись
+# держит бинарное изображение в полном разрешении (около 12 МБ для скана
+# 4000×3000), поэтому кэш намеренно небольшой
+_CACHE_SIZE = 16
+
+# Блок чтения файла при вычислении его хеша
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def make_preview(image: np.ndarray, width: int = PREVIEW_WIDTH) -> Tuple[np.ndarray, float]:
+    """Уменьшает изображение до заданной ширины (``INTER_AREA``).
+
+    Изображения уже не шире ``width`` возвращаются без изменений
+    (без копирования).
+
+    :param image: исходное изображение
+    :param width: максимальная ширина превью
+    :return: (превью, коэффициент масштабирования)
+    """
+    scale = min(1.0, width / image.shape[1])
+    if scale < 1.0:
+        image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    return image, scale
+
+
+class FileKey:
+    """Ключ кэшей, привязанных к файлу изображения.
+
+    Ключи равны, если совпадает SHA-1 содержимого файлов: повторная
+    загрузка тех же байтов под другим именем попадает в кэш. Путь нужен
+    только для чтения файла при промахе и в сравнении не участвует.
+    """
+    __slots__ = ('digest', 'path')
+
+    def __init__(self, digest: str, path: str) -> None:
+        self.digest = digest
+        self.path = path
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FileKey) and self.digest == other.digest
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _cached_images(key: FileKey) -> Tuple[np.ndarray, np.ndarray]:
+    """Кэшируемая загрузка и предобработка изображения.
+
+    Файл читается один раз: из него получаются бинаризованное изображение
+    и превью шириной не более ``PREVIEW_WIDTH``; сам оригинал после этого
+    не хранится. Возвращаемые массивы помечаются как неизменяемые, чтобы
+    вызывающий код не мог испортить закэшированные данные.
+    """
+    image = load_image(key.path)
+    processed = preprocess_image(image)
+    preview, _ = make_preview(image)
+    processed.setflags(write=False)
+    preview.setflags(write=False)
+    return processed, preview
+
+
+class ProcessedImage(NamedTuple):
+    """Предобработанное изображение вместе со статистикой связных компонент.
+
+    Все массивы доступны только для чтения. Карта меток компонент не
+    хранится: она занимает больше памяти, чем само изображение, и
+    анализаторам не нужна.
+    """
+    binary: np.ndarray
+    stats: np.ndarray
+    centroids: np.ndarray
+
+
+def component_stats(binary_image: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Статистика связных компонент бинарного изображения.
+
+    Один вызов `cv2.connectedComponentsWithStats` даёт ограничивающие
+    прямоугольники, площади и центры всех компонент за один проход по
+    изображению. Строка фона (метка 0) отбрасывается.
+
+    :param binary_image: бинарное изображение (буквы — белые пиксели)
+    :return: (stats, centroids) — массивы размером N×5 и N×2 (только для чтения)
+    """
+    _, _, stats, centroids = cv2.connectedComponentsWithStats(binary_image, connectivity=8)
+    stats, centroids = stats[1:], centroids[1:]
+    stats.setflags(write=False)
+    centroids.setflags(write=False)
+    return stats, centroids
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _cached_bundle(key: FileKey) -> ProcessedImage:
+    """Кэшируемая предобработка вместе со статистикой компонент."""
+    binary, _ = _cached_images(key)
+    return ProcessedImage(binary, *component_stats(binary))
+
+
+@lru_cache(maxsize=256)
+def _file_digest(path: str, mtime: int, size: int) -> str:
+    """SHA-1 содержимого файла; пересчитывается только при его изменении."""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_cache_key(path: str) -> FileKey:
+    """Возвращает ключ кэша для файла изображения.
+
+    Используется всеми кэшами, привязанными к файлу изображения. Ключ
+    определяется содержимым файла: замена файла по тому же пути меняет
+    ключ, а копия тех же байтов по другому пути — нет. Хеш вычисляется
+    один раз для каждой версии файла (по времени модификации и размеру).
+
+    :param path: путь к файлу изображения
+    :return: :class:`FileKey` для передачи в кэшируемые функции
+    :raises FileNotFoundError: если файл не существует или не читается
+    """
+    try:
+        st = os.stat(path)
+        digest = _file_digest(path, st.st_mtime_ns, st.st_size)
+    except OSError as exc:
+        raise FileNotFoundError(f"Не удалось загрузить изображение: {path}") from exc
+    return FileKey(digest, path)
+
+
+def load_preview_cached(path: str) -> np.ndarray:
+    """Возвращает превью изображения, используя кэш по содержимому файла.
+
+    Превью получается при той же загрузке файла, что и бинаризованное
+    изображение в :func:`preprocess_image_cached`. Его масштаб относительно
+    оригинала равен ``preview.shape[1] / binary.shape[1]``. Массив доступен
+    только для чтения; для рисования поверх него необходимо сделать копию.
+
+    :param path: путь к файлу изображения
+    :return: изображение шириной не более ``PREVIEW_WIDTH`` (только для чтения)
+    """
+    return _cached_images(file_cache_key(path))[1]
+
+
+def preprocess_image_cached(path: str) -> np.ndarray:
+    """Загружает и предобрабатывает изображение с кэшированием результата.
+
+    Эквивалентно ``preprocess_image(load_image(path))``, но повторные
+    вызовы для того же файла не выполняют бинаризацию заново.
+
+    :param path: путь к файлу изображения
+    :return: бинаризированное изображение (только для чтения)
+    """
+    return _cached_images(file_cache_key(path))[0]
+
+
+def preprocess_bundle_cached(path: str) -> ProcessedImage:
+    """Возвращает предобработанное изображение и статистику его компонент.
+
+    Бинарное изображение берётся из того же кэша, что и в
+    :func:`preprocess_image_cached`; разметка компонент выполняется один
+    раз для каждой версии файла.
+
+    :param path: путь к файлу изображения
+    :return: :class:`ProcessedImage` (все массивы только для чтения)
+    """
+    return _cached_bundle(file_cache_key(path))
+
+
 def preprocess_image(image: np.ndarray) -> np.ndarray:
     """Выполняет базовую предварительную обработку изображения.
 
@@ -38,13 +212,79 @@ def preprocess_image(image: np.ndarray) -> np.ndarray:
     """
     # Переводим изображение в оттенки серого
     gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    # Гауссово размытие для сглаживания
-    blurred = cv2.GaussianBlur(gray, (5, 5), 0)
-    # Бинаризация методом Отсу
-    _, binary = cv2.threshold(blurred, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-    # Инвертируем изображение: буквы белые, фон чёрный
-    inverted = 255 - binary
-    return inverted
+    # Гауссово размытие для сглаживания (на месте: исходный серый
+    # вариант дальше не нужен)
+    cv2.GaussianBlur(gray, (5, 5), 0, dst=gray)
+    # Бинаризация методом Отсу с инверсией за один проход:
+    # буквы белые, фон чёрный
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    return binary
+
+
+def row_projection(image: np.ndarray) -> np.ndarray:
+    """Горизонтальная проекция — количество белых пикселей в каждом ряду.
+
+    Результат совпадает с ``np.sum(image // 255, axis=1)`` для любого
+    входа. Для двумерных изображений ``uint8`` это число пикселей со
+    значением 255: они отбираются `cv2.threshold` и суммируются
+    `cv2.reduce` с освобождением GIL, что в несколько раз быстрее
+    вычисления через NumPy. Прочие массивы обрабатываются через NumPy.
+
+    :param image: бинарное изображение (белые пиксели — 255)
+    :return: одномерный массив длиной, равной высоте изображения
+    """
+    if image.ndim == 2 and image.dtype == np.uint8:
+        _, mask = cv2.threshold(image, 254, 1, cv2.THRESH_BINARY)
+        return cv2.reduce(mask, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel()
+    return np.sum(image // 255, axis=1)
+
+
+def find_line_bounds(projection: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Находит границы строк по горизонтальной проекции.
+
+    Строкой считается непрерывный участок, где проекция превышает порог.
+    Вместо цикла по рядам пикселей берутся индексы рядов выше порога, и
+    строки выделяются как непрерывные серии этих индексов.
+
+    :param projection: количество белых пикселей в каждом ряду
+    :param threshold: порог, выше которого ряд относится к строке текста
+    :return: (начала строк, концы строк); конец не включается в строку
+    """
+    positions = np.flatnonzero(projection > threshold)
+    if positions.size == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    # Разрыв между соседними индексами означает границу между строками
+    breaks = np.flatnonzero(np.diff(positions) > 1)
+    starts = np.r_[positions[0], positions[breaks + 1]]
+    ends = np.r_[positions[breaks], positions[-1]] + 1
+    return starts, ends
+
+
+def text_line_bounds(image: np.ndarray, *, line_threshold: float = 0.1) -> Tuple[np.ndarray, np.ndarray]:
+    """Находит границы строк текста на бинарном изображении.
+
+    Строки определяются так же, как в :func:`segment_text`, но без
+    вырезания их изображений — этого достаточно, например, для подсчёта
+    строк.
+
+    :param image: бинарное изображение (желательно уже инвертированное)
+    :param line_threshold: доля от максимальной суммы по строке, ниже которой
+        принимается решение об интервале между строками
+    :return: (начала строк, концы строк); конец не включается в строку
+    """
+    # Вычисляем горизонтальную проекцию – количество белых пикселей в каждой строке
+    projection = row_projection(image)
+    max_val = projection.max()
+    if max_val == 0:
+        # Нет текста
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+
+    starts, ends = find_line_bounds(projection, max_val * line_threshold)
+    # Отсекаем слишком низкие (пустые) строки
+    keep = ends - starts > 2
+    return starts[keep], ends[keep]
 
 
 def segment_text(image: np.ndarray, *, line_threshold: float = 0.1) -> List[np.ndarray]:
@@ -59,34 +299,5 @@ def segment_text(image: np.ndarray, *, line_threshold: float = 0.1) -> List[np.n
         принимается решение об интервале между строками
     :return: список изображений строк
     """
-    # Вычисляем горизонтальную проекцию – количество белых пикселей в каждой строке
-    projection = np.sum(image // 255, axis=1)
-    max_val = projection.max()
-    if max_val == 0:
-        # Нет текста
-        return []
-
-    threshold_value = max_val * line_threshold
-    lines: List[np.ndarray] = []
-    in_line = False
-    start_row = 0
-    for i, val in enumerate(projection):
-        if val > threshold_value and not in_line:
-            # Начинается строка
-            in_line = True
-            start_row = i
-        elif val <= threshold_value and in_line:
-            # Заканчивается строка
-            end_row = i
-            line_img = image[start_row:end_row, :]
-            # Отсекаем пустые строки
-            if line_img.shape[0] > 2:
-                lines.append(line_img)
-            in_line = False
-    # Обработка последней строки, если файл заканчивается текстом
-    if in_line:
-        end_row = len(projection)
-        line_img = image[start_row:end_row, :]
-        if line_img.shape[0] > 2:
-            lines.append(line_img)
-    return lines
\ No newline at end of file
+    starts, ends = text_line_bounds(image, line_threshold=line_threshold)
+    return [image[start_row:end_row, :] for start_row, end_row in zip(starts, ends)]
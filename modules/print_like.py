@@ -7,10 +7,9 @@
 почерк к печатному типу.
 """
 
-from typing import List
 import cv2
 import numpy as np
-from . import preprocessing, general_features
+from . import preprocessing, feature_cache
 
 
 def analyze_print_like(image_path: str) -> str:
@@ -20,23 +19,15 @@ def analyze_print_like(image_path: str) -> str:
     :return: текстовый отчёт о признаках печатного письма
     """
     try:
-        image = preprocessing.load_image(image_path)
+        connectivity = feature_cache.feature_bundle(image_path)['connectivity']
+        _, stats, _ = preprocessing.preprocess_bundle_cached(image_path)
     except FileNotFoundError as exc:
         return str(exc)
-    proc = preprocessing.preprocess_image(image)
-    connectivity = general_features.compute_connectivity(proc)
-    # Оцениваем соотношения сторон символов
-    contours, _ = cv2.findContours(proc, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-    aspect_ratios: List[float] = []
-    for cnt in contours:
-        area = cv2.contourArea(cnt)
-        if area < 20:
-            continue
-        x, y, w, h = cv2.boundingRect(cnt)
-        if h == 0:
-            continue
-        aspect_ratios.append(w / h)
-    avg_aspect = float(np.mean(aspect_ratios)) if aspect_ratios else 0.0
+    # Оцениваем соотношения сторон символов по уже посчитанной статистике
+    # компонент; компоненты площадью меньше 20 пикселей считаются шумом
+    letters = stats[stats[:, cv2.CC_STAT_AREA] >= 20]
+    aspect_ratios = letters[:, cv2.CC_STAT_WIDTH] / letters[:, cv2.CC_STAT_HEIGHT]
+    avg_aspect = float(np.mean(aspect_ratios)) if aspect_ratios.size else 0.0
     # Эвристика: печатное письмо — низкая связность (<0.1) и среднее
     # соотношение ширины к высоте в пределах 0.5–1.5 (буквы квадратные/высокие)
     if connectivity < 0.1:
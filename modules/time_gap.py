@@ -8,11 +8,32 @@
 и анализировать динамику признаков.
 """
 
-from typing import List, Tuple
-from . import preprocessing, general_features
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+from . import feature_cache
 import os
 
 
+def _sample_features(path: str) -> Optional[Tuple[str, float, float, float, float]]:
+    """Вычисляет общие признаки одного образца.
+
+    :param path: путь к изображению
+    :return: (имя файла, размер, интервал, наклон, связность) или ``None``,
+        если файл не удалось загрузить
+    """
+    try:
+        features = feature_cache.feature_bundle(path)
+    except FileNotFoundError:
+        return None
+    return (
+        os.path.basename(path),
+        features['size_mean'],
+        features['spacing_mean'],
+        features['slant'],
+        features['connectivity'],
+    )
+
+
 def analyze_time_gap(image_paths: str) -> str:
     """Анализ почерка, выполненного с разрывом во времени.
 
@@ -26,18 +47,15 @@ def analyze_time_gap(image_paths: str) -> str:
     paths: List[str] = [p.strip() for p in image_paths.split(',') if p.strip()]
     if not paths:
         return "Путь к изображению не указан."
+    # Образцы независимы друг от друга; OpenCV освобождает GIL, поэтому
+    # обработка в потоках выполняется параллельно
+    with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as executor:
+        samples = list(executor.map(_sample_features, paths))
     results: List[Tuple[str, float, float, float, float]] = []  # name, size, spacing, slant, conn
-    for path in paths:
-        try:
-            img = preprocessing.load_image(path)
-        except FileNotFoundError:
+    for path, sample in zip(paths, samples):
+        if sample is None:
             return f"Файл {path} не найден."
-        proc = preprocessing.preprocess_image(img)
-        size, _ = general_features.compute_letter_sizes(proc)
-        spacing, _ = general_features.compute_spacing(proc)
-        slant = general_features.compute_slant(proc)
-        conn = general_features.compute_connectivity(proc)
-        results.append((os.path.basename(path), size, spacing, slant, conn))
+        results.append(sample)
     lines = ["Анализ почерка с разрывом во времени:"]
     for idx, (name, size, spacing, slant, conn) in enumerate(results):
         lines.append(
@@ -8,9 +8,18 @@
 необычные условия.
 """
 
-from typing import List
+from bisect import bisect_left
 import numpy as np
-from . import preprocessing, general_features
+from . import feature_cache
+
+
+# Эвристические пороги суммарной вариативности и выводы в порядке её возрастания
+_VARIABILITY_THRESHOLDS = (8, 15)
+_VERDICTS = (
+    'признаки необычных условий не обнаружены',
+    'возможно влияние условий на письмо',
+    'вероятны необычные условия письма (большая вариативность)',
+)
 
 
 def analyze_unusual_conditions(image_path: str) -> str:
@@ -20,37 +29,18 @@ def analyze_unusual_conditions(image_path: str) -> str:
     :return: текстовый отчёт о вероятности необычных условий
     """
     try:
-        image = preprocessing.load_image(image_path)
+        line_features = feature_cache.line_features(image_path)
     except FileNotFoundError as exc:
         return str(exc)
-    proc = preprocessing.preprocess_image(image)
-    lines = preprocessing.segment_text(proc)
-    if not lines:
+    if line_features.shape[1] == 0:
         return (
             f"Не удалось найти текст на изображении {image_path} для анализа условий."
         )
-    sizes: List[float] = []
-    spacings: List[float] = []
-    slants: List[float] = []
-    for line_img in lines:
-        size, _ = general_features.compute_letter_sizes(line_img)
-        spacing, _ = general_features.compute_spacing(line_img)
-        slant = general_features.compute_slant(line_img)
-        sizes.append(size)
-        spacings.append(spacing)
-        slants.append(slant)
     # Расчет разбросов
-    size_std = float(np.std(np.array(sizes)))
-    spacing_std = float(np.std(np.array(spacings)))
-    slant_std = float(np.std(np.array(slants)))
+    size_std, spacing_std, slant_std = (float(std) for std in np.std(line_features, axis=1))
     variability = size_std + spacing_std + slant_std
-    # Эвристический порог для необычных условий
-    if variability > 15:
-        verdict = 'вероятны необычные условия письма (большая вариативность)'
-    elif variability > 8:
-        verdict = 'возможно влияние условий на письмо'
-    else:
-        verdict = 'признаки необычных условий не обнаружены'
+    # bisect_left: значение, равное порогу, относится к нижней категории
+    verdict = _VERDICTS[bisect_left(_VARIABILITY_THRESHOLDS, variability)]
     report = (
         f"Анализ условий письма ({image_path}):\n"
         f"Стандартное отклонение размеров: {size_std:.1f}\n"
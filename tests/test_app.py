@@ -0,0 +1,118 @@
+"""
+Tests for the web application helpers.
+
+These tests cover the image encoding used to embed results into the HTML
+pages.  They call the helpers directly and do not start a server.
+"""
+import base64
+import io
+import os
+import numpy as np
+import cv2
+from signature_detector import app as webapp
+
+
+def test_image_to_base64_keeps_grayscale_png():
+    """A binarized image is encoded as single-channel PNG without loss."""
+    img = np.zeros((20, 30), dtype=np.uint8)
+    img[5:15, 5:25] = 255
+    data_url = webapp._image_to_base64(img, ext='.png')
+    assert data_url.startswith('data:image/png;base64,')
+    raw = base64.b64decode(data_url.split(',', 1)[1])
+    decoded = cv2.imdecode(np.frombuffer(raw, np.uint8), cv2.IMREAD_UNCHANGED)
+    assert decoded.ndim == 2
+    assert decoded.dtype == np.uint8
+    assert np.array_equal(decoded, img)
+
+
+def test_allowed_file_checks_suffix_case_insensitively():
+    """Only the final extension matters, regardless of letter case."""
+    assert webapp.allowed_file('scan.PNG')
+    assert webapp.allowed_file('photo.final.jpeg')
+    assert not webapp.allowed_file('scan.png.exe')
+    assert not webapp.allowed_file('png')
+    assert not webapp.allowed_file('noext.')
+
+
+def test_compare_result_template_formats_numbers():
+    """The comparison page renders formatted values instead of failing."""
+    details = {
+        'size_avg': (12.345, 13.0),
+        'spacing_avg': (4.0, 5.55),
+        'slant': (-3.21, 2.0),
+        'connectivity': (0.5, 0.756),
+    }
+    with webapp.app.test_request_context():
+        html = webapp._COMPARE_RESULT_TMPL.render(
+            similarity=0.8765,
+            interpretation='высокое сходство',
+            details=details,
+            img_a_b64='',
+            img_b_b64='',
+        )
+    assert 'Коэффициент сходства: 0.88' in html
+    assert '12.3 vs 13.0' in html
+    assert '-3.2° vs 2.0°' in html
+    assert '0.50 vs 0.76' in html
+    assert '<img' not in html
+
+
+def test_large_malformed_upload_redirects():
+    """A large body that is not a multipart form is treated as a missing file."""
+    client = webapp.app.test_client()
+    body = b'x' * (webapp.STREAMING_UPLOAD_THRESHOLD + 1)
+    for content_type in ('application/octet-stream',
+                         'multipart/form-data; boundary=zzz'):
+        response = client.post('/', data=body, headers={'Content-Type': content_type})
+        assert response.status_code == 302
+    assert not [name for name in os.listdir(webapp.UPLOAD_FOLDER)
+                if name.endswith('.part')]
+
+
+def test_uploads_are_removed_after_response():
+    """Uploaded images live only until the response has been sent."""
+    img = np.full((120, 200), 255, dtype=np.uint8)
+    cv2.putText(img, 'abc', (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 1.5, 0, 3)
+    png = cv2.imencode('.png', img)[1].tobytes()
+    before = set(os.listdir(webapp.UPLOAD_FOLDER))
+    client = webapp.app.test_client()
+    response = client.post('/', data={'file': (io.BytesIO(png), 'scan.png')},
+                           content_type='multipart/form-data')
+    assert response.status_code == 200
+    html = response.get_data(as_text=True)
+    assert 'data:image/png;base64,' in html
+    # The report names the user's file, not the server's temporary path
+    assert 'Изображение: scan.png' in html
+    assert webapp.UPLOAD_FOLDER not in html
+    response.close()
+    assert set(os.listdir(webapp.UPLOAD_FOLDER)) == before
+
+
+def test_repeated_upload_of_same_bytes_hits_cache():
+    """Each upload gets a new file name, but identical bytes reuse the cached results."""
+    img = np.full((120, 200), 255, dtype=np.uint8)
+    cv2.putText(img, 'xyz', (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 1.5, 0, 3)
+    png = cv2.imencode('.png', img)[1].tobytes()
+    client = webapp.app.test_client()
+    cache = webapp.preprocessing._cached_images
+    cache.cache_clear()
+    for expected_misses in (1, 1):
+        response = client.post('/', data={'file': (io.BytesIO(png), 'scan.png')},
+                               content_type='multipart/form-data')
+        assert response.status_code == 200
+        response.get_data()
+        response.close()
+        assert cache.cache_info().misses == expected_misses
+    assert cache.cache_info().hits > 0
+
+
+def test_oversized_upload_is_rejected(monkeypatch):
+    """Requests above MAX_CONTENT_LENGTH get 413 and leave no files behind."""
+    monkeypatch.setitem(webapp.app.config, 'MAX_CONTENT_LENGTH', webapp.STREAMING_UPLOAD_THRESHOLD * 2)
+    body = b'\0' * (webapp.STREAMING_UPLOAD_THRESHOLD * 3)
+    before = set(os.listdir(webapp.UPLOAD_FOLDER))
+    client = webapp.app.test_client()
+    response = client.post('/', data={'file': (io.BytesIO(body), 'scan.png')},
+                           content_type='multipart/form-data')
+    assert response.status_code == 413
+    assert set(os.listdir(webapp.UPLOAD_FOLDER)) == before
@@ -0,0 +1,45 @@
+"""
+Tests for the feature_cache module.
+
+The shared feature bundle must agree with the fused feature extraction
+and must be computed only once per unchanged file.
+"""
+import numpy as np
+import cv2
+import pytest
+from signature_detector.modules import feature_cache, general_features, preprocessing
+
+
+def create_text_image(path: str):
+    """Create a synthetic page with two lines of dark 'letters' on white."""
+    img = np.full((120, 200, 3), 255, dtype=np.uint8)
+    for top in (15, 70):
+        for left in range(10, 180, 30):
+            cv2.rectangle(img, (left, top), (left + 12, top + 25 + left % 7), (0, 0, 0), thickness=-1)
+    cv2.imwrite(path, img)
+
+
+def test_feature_bundle_matches_analyze_all_and_is_cached(tmp_path):
+    path = str(tmp_path / 'page.png')
+    create_text_image(path)
+    bundle = feature_cache.feature_bundle(path)
+    assert feature_cache.feature_bundle(path) is bundle
+    expected = general_features.analyze_all(preprocessing.preprocess_image(preprocessing.load_image(path)))
+    for key, value in expected.items():
+        assert bundle[key] == value
+    assert bundle['num_lines'] == 2
+    assert 'line_features' not in bundle
+
+
+def test_line_features_are_cached_per_line(tmp_path):
+    path = str(tmp_path / 'page.png')
+    create_text_image(path)
+    line_features = feature_cache.line_features(path)
+    assert feature_cache.line_features(path) is line_features
+    assert line_features.shape == (3, feature_cache.feature_bundle(path)['num_lines'])
+    assert not line_features.flags.writeable
+
+
+def test_feature_bundle_reports_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        feature_cache.feature_bundle(str(tmp_path / 'missing.png'))
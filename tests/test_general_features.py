@@ -6,6 +6,7 @@ connectivity on simple synthetic binary images.
 """
 import numpy as np
 import cv2
+import pytest
 from signature_detector.modules import general_features
 
 
@@ -44,3 +45,28 @@ def test_compute_connectivity():
     # connectivity should be 0, as there are no connected letters
     conn = general_features.compute_connectivity(img)
     assert conn == 0.0
+
+
+def test_analyze_all_matches_individual_features():
+    img = create_binary_image_with_letters()
+    features = general_features.analyze_all(img)
+    assert (features['size_mean'], features['size_std']) == general_features.compute_letter_sizes(img)
+    assert (features['spacing_mean'], features['spacing_std']) == general_features.compute_spacing(img)
+    assert features['slant'] == general_features.compute_slant(img)
+    assert features['connectivity'] == general_features.compute_connectivity(img)
+
+
+def test_memoized_features_ignore_views_and_are_immutable():
+    img = create_binary_image_with_letters()
+    img.setflags(write=False)
+    features = general_features.analyze_all(img)
+    assert general_features.analyze_all(img) is features
+    with pytest.raises(TypeError):
+        features['slant'] = 0.0
+    # A read-only view of a writable buffer must not be served from the memo
+    buffer = create_binary_image_with_letters()
+    view = buffer[:]
+    view.setflags(write=False)
+    before = general_features.compute_letter_sizes(view)
+    buffer[:] = 0
+    assert general_features.compute_letter_sizes(view) != before
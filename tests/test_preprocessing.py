@@ -29,3 +29,79 @@ def test_preprocess_image_basic(tmp_path):
     assert set(unique_vals.tolist()).issubset({0, 255})
     # The white rectangle should remain white (255) in the processed image
     assert processed[50, 100] == 255
+
+
+def test_preprocess_image_cached_reuses_and_invalidates(tmp_path):
+    """Cached preprocessing returns the same read-only array until the file changes."""
+    img = np.zeros((60, 120, 3), dtype=np.uint8)
+    cv2.rectangle(img, (20, 20), (100, 40), (255, 255, 255), thickness=-1)
+    tmp_file = tmp_path / 'cached.png'
+    cv2.imwrite(str(tmp_file), img)
+    first = preprocessing.preprocess_image_cached(str(tmp_file))
+    assert not first.flags.writeable
+    assert preprocessing.preprocess_image_cached(str(tmp_file)) is first
+    # Replacing the file (different size on disk) must invalidate the cache
+    cv2.imwrite(str(tmp_file), np.zeros((80, 160, 3), dtype=np.uint8))
+    second = preprocessing.preprocess_image_cached(str(tmp_file))
+    assert second is not first
+    assert second.shape == (80, 160)
+
+
+def test_load_preview_cached_keeps_only_small_copy(tmp_path):
+    """The cache holds a preview no wider than PREVIEW_WIDTH, not the original."""
+    width = preprocessing.PREVIEW_WIDTH * 2
+    tmp_file = tmp_path / 'wide.png'
+    cv2.imwrite(str(tmp_file), np.full((100, width, 3), 255, dtype=np.uint8))
+    preview = preprocessing.load_preview_cached(str(tmp_file))
+    assert preview.shape == (50, preprocessing.PREVIEW_WIDTH, 3)
+    assert not preview.flags.writeable
+    assert preprocessing.load_preview_cached(str(tmp_file)) is preview
+    assert preprocessing.preprocess_image_cached(str(tmp_file)).shape == (100, width)
+
+
+def test_preprocess_bundle_cached_shares_binary_and_counts_components(tmp_path):
+    """The bundle reuses the cached binary image and reports each letter once."""
+    img = np.full((60, 120, 3), 255, dtype=np.uint8)
+    cv2.rectangle(img, (10, 15), (30, 45), (0, 0, 0), thickness=-1)
+    cv2.rectangle(img, (60, 15), (80, 45), (0, 0, 0), thickness=-1)
+    tmp_file = tmp_path / 'letters.png'
+    cv2.imwrite(str(tmp_file), img)
+    bundle = preprocessing.preprocess_bundle_cached(str(tmp_file))
+    assert bundle.binary is preprocessing.preprocess_image_cached(str(tmp_file))
+    assert bundle.stats.shape == (2, 5)
+    assert bundle.centroids.shape == (2, 2)
+    assert not bundle.stats.flags.writeable
+
+
+def test_find_line_bounds_includes_open_ended_line():
+    """Runs above the threshold are reported, including one touching the end."""
+    projection = np.array([0, 5, 6, 0, 0, 7, 0, 3, 9])
+    starts, ends = preprocessing.find_line_bounds(projection, 2)
+    assert starts.tolist() == [1, 5, 7]
+    assert ends.tolist() == [3, 6, 9]
+    starts, ends = preprocessing.find_line_bounds(np.zeros(5), 0)
+    assert starts.size == 0 and ends.size == 0
+
+
+def test_segment_text_keeps_lines_touching_image_edges():
+    """Lines starting at the first row or ending at the last row are kept."""
+    img = np.zeros((40, 30), dtype=np.uint8)
+    img[0:5, 5:25] = 255
+    img[15:17, 5:25] = 255  # too thin, dropped as noise
+    img[32:40, 5:25] = 255
+    lines = preprocessing.segment_text(img)
+    assert [line.shape[0] for line in lines] == [5, 8]
+    assert np.shares_memory(lines[1], img)
+
+
+def test_row_projection_matches_numpy_for_any_input():
+    """Only pixels equal to 255 count, for uint8 and other dtypes alike."""
+    img = np.zeros((40, 60), dtype=np.uint8)
+    img[5:15, 10:50] = 255
+    img[25:35, 10:50] = 128
+    expected = np.sum(img // 255, axis=1)
+    assert np.array_equal(preprocessing.row_projection(img), expected)
+    assert np.array_equal(preprocessing.row_projection(img.astype(np.int32)), expected)
+    # The gray band is not text, and an int32 mask is segmented like uint8
+    assert [line.shape for line in preprocessing.segment_text(img)] == [(10, 60)]
+    assert [line.shape for line in preprocessing.segment_text(img.astype(np.int32))] == [(10, 60)]
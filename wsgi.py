@@ -0,0 +1,9 @@
+"""Точка входа WSGI для запуска приложения в production.
+
+Пример запуска через gunicorn (по одному процессу на ядро, по четыре
+потока в каждом):
+
+    gunicorn -w $(nproc) -k gthread --threads 4 wsgi:app
+"""
+
+from app import app  # noqa: F401